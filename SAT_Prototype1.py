@@ -7,6 +7,24 @@ import numpy as np
 import matplotlib.lines as mlines
 import matplotlib as mpl
 from matplotlib.widgets import Button
+import logging
+import time
+import json
+import os
+import tempfile
+
+# Logging (raise to logging.DEBUG to trace every click and mode change)
+LOG_LEVEL = logging.WARNING
+logging.basicConfig(format="%(levelname)s: %(message)s")
+logger = logging.getLogger("SAT")
+logger.setLevel(LOG_LEVEL)
+
+# Redraw scheduler settings
+MAX_FPS = 30  # cap on full renders per second; bursts of input are merged into one
+
+# Export settings
+EXPORT_BASENAME = "surface_analysis"  # writes surface_analysis.svg and surface_analysis.geojson
+SVG_SCALE = 100  # SVG pixels per map unit
 
 #Disabling keys for functionality
 mpl.rcParams['keymap.xscale'] = ''  # disables 'l' for x-axis zoom
@@ -62,57 +80,73 @@ mode_text = ax.text(
 
 marker_state = {'type': 'H', 'positions': []}
 drawing_front = {'type': 'cold', 'points': []}
+analysis_fronts = []  # completed fronts as {'type': ..., 'points': [...]}, kept for export
+
+# Redraw scheduler: input handlers mark the figure dirty instead of rendering directly,
+# and all requests that arrive within one frame are merged into a single draw.
+redraw_state = {'dirty': False, 'pending': False, 'last_draw': 0.0}
+redraw_timer = fig.canvas.new_timer(interval=int(1000 / MAX_FPS))
+redraw_timer.single_shot = True
+
+def flush_redraw():
+    redraw_state['pending'] = False
+    if not redraw_state['dirty']:
+        return
+    redraw_state['dirty'] = False
+    redraw_state['last_draw'] = time.monotonic()
+    fig.canvas.draw_idle()
+
+redraw_timer.add_callback(flush_redraw)
+
+def request_redraw():
+    """
+    Mark the figure as dirty and schedule a render no sooner than
+    1 / MAX_FPS seconds after the previous one.
+    """
+    redraw_state['dirty'] = True
+    if redraw_state['pending']:
+        return
+    redraw_state['pending'] = True
+    elapsed = time.monotonic() - redraw_state['last_draw']
+    delay = max(0.0, 1.0 / MAX_FPS - elapsed)
+    redraw_timer.interval = max(1, int(delay * 1000))
+    redraw_timer.start()
 
 def on_key(event):
     if event.key == 'c':
-        drawing_front['type'] = 'cold'
-        drawing_front['points'].clear()
-        marker_state['type'] = None
-        mode_text.set_text("Mode: Cold Front")
-        fig.canvas.draw_idle()
-        print("Cold front mode (blue)")
+        set_mode_cold(event)
+        logger.debug("Cold front mode (blue)")
 
     elif event.key == 'w':
-        drawing_front['type'] = 'warm'
-        drawing_front['points'].clear()
-        marker_state['type'] = None
-        mode_text.set_text("Mode: Warm Front")
-        fig.canvas.draw_idle()
-        print("Warm front mode (red)")
+        set_mode_warm(event)
+        logger.debug("Warm front mode (red)")
 
     elif event.key == 'o':
-        drawing_front['type'] = 'occluded'
-        drawing_front['points'].clear()
-        marker_state['type'] = None
-        mode_text.set_text("Mode: Occluded Front")
-        fig.canvas.draw_idle()
-        print("Occluded front mode (purple)")
+        set_mode_occluded(event)
+        logger.debug("Occluded front mode (purple)")
 
     elif event.key == 's':
-        drawing_front['type'] = 'stationary'
-        drawing_front['points'].clear()
-        marker_state['type'] = None
-        mode_text.set_text("Mode: Stationary Front")
-        fig.canvas.draw_idle()
-        print("Stationary front mode")
+        set_mode_stationary(event)
+        logger.debug("Stationary front mode")
 
     elif event.key == 'h':
         marker_state['type'] = 'H'
         mode_text.set_text("Mode: High Pressure Marker")
-        fig.canvas.draw_idle()
-        print("High pressure marker mode (blue H)")
+        request_redraw()
+        logger.debug("High pressure marker mode (blue H)")
 
     elif event.key == 'l':
         marker_state['type'] = 'L'
         mode_text.set_text("Mode: Low Pressure Marker")
-        fig.canvas.draw_idle()
-        print("Low pressure marker mode (red L)")
+        request_redraw()
+        logger.debug("Low pressure marker mode (red L)")
 
     elif event.key == 'd':
-        drawing_front['type'] = 'dryline'
-        drawing_front['points'].clear()
-        marker_state['type'] = None
-        print("Dryline mode (orange, unfilled semicircles)")
+        set_mode_dryline(event)
+        logger.debug("Dryline mode (orange, unfilled semicircles)")
+
+    elif event.key == 'e':
+        export_analysis(event)
 
 
     if event.key == 'enter':
@@ -127,8 +161,13 @@ def on_key(event):
                 draw_stationary_front(ax, drawing_front['points'])
             elif drawing_front['type'] == 'dryline':
                 draw_dryline(ax, drawing_front['points'])
+            else:
+                # No front mode selected: nothing was drawn, so nothing to record
+                drawing_front['points'].clear()
+                return
+            analysis_fronts.append({'type': drawing_front['type'], 'points': list(drawing_front['points'])})
             drawing_front['points'].clear()
-            fig.canvas.draw()
+            request_redraw()
 
 def on_click(event):
     if event.inaxes != ax:
@@ -137,14 +176,15 @@ def on_click(event):
         color = 'blue' if marker_state['type'] == 'H' else 'red'
         text = ax.text(event.xdata, event.ydata, marker_state['type'], color=color, fontsize=20, fontweight='bold', ha='center', va='center')
         drawable_artists.append(text)
-        fig.canvas.draw()
-        print(f"Placed {marker_state['type']} at ({event.xdata:.2f}, {event.ydata:.2f})")
+        marker_state['positions'].append((marker_state['type'], event.xdata, event.ydata))
+        request_redraw()
+        logger.debug("Placed %s at (%.2f, %.2f)", marker_state['type'], event.xdata, event.ydata)
     else:
         drawing_front['points'].append((event.xdata, event.ydata))
         dot, = ax.plot(event.xdata, event.ydata, 'ko', markersize=6)
         drawable_artists.append(dot)
-        print(f"Point added: ({event.xdata:.2f}, {event.ydata:.2f})")
-        fig.canvas.draw()
+        logger.debug("Point added: (%.2f, %.2f)", event.xdata, event.ydata)
+        request_redraw()
 
 #Function to clear all fronts, markers, dots, etc.
 def clear_fronts_and_markers(event):
@@ -152,162 +192,131 @@ def clear_fronts_and_markers(event):
         artist.remove()
     drawable_artists.clear()
     drawing_front['points'].clear()
-    fig.canvas.draw()
+    analysis_fronts.clear()
+    marker_state['positions'].clear()
+    request_redraw()
 
 def set_mode_default(event):
     drawing_front['type'] = None
     drawing_front['points'].clear()
     marker_state['type'] = None
     mode_text.set_text("Mode: Default")
-    fig.canvas.draw_idle()
+    request_redraw()
 
 def set_mode_cold(event):
     drawing_front['type'] = 'cold'
     drawing_front['points'].clear()
     marker_state['type'] = None
     mode_text.set_text("Mode: Cold Front")
-    fig.canvas.draw_idle()
+    request_redraw()
 
 def set_mode_warm(event):
     drawing_front['type'] = 'warm'
     drawing_front['points'].clear()
     marker_state['type'] = None
     mode_text.set_text("Mode: Warm Front")
-    fig.canvas.draw_idle()
+    request_redraw()
 
 def set_mode_occluded(event):
     drawing_front['type'] = 'occluded'
     drawing_front['points'].clear()
     marker_state['type'] = None
     mode_text.set_text("Mode: Occluded Front")
-    fig.canvas.draw_idle()
+    request_redraw()
 
 def set_mode_stationary(event):
     drawing_front['type'] = 'stationary'
     drawing_front['points'].clear()
     marker_state['type'] = None
     mode_text.set_text("Mode: Stationary Front")
-    fig.canvas.draw_idle()
+    request_redraw()
 
 def set_mode_dryline(event):
     drawing_front['type'] = 'dryline'
     drawing_front['points'].clear()
     marker_state['type'] = None
     mode_text.set_text("Mode: Dryline")
-    fig.canvas.draw_idle()
+    request_redraw()
 
 def set_mode_high(event):
     marker_state['type'] = 'H'
     drawing_front['type'] = None
     drawing_front['points'].clear()
     mode_text.set_text("Mode: High Pressure Marker")
-    fig.canvas.draw_idle()
+    request_redraw()
 
 def set_mode_low(event):
     marker_state['type'] = 'L'
     drawing_front['type'] = None
     drawing_front['points'].clear()
     mode_text.set_text("Mode: Low Pressure Marker")
-    fig.canvas.draw_idle()
+    request_redraw()
 
 
 
 
      
 
-def draw_cold_front(ax, points):
-    x_vals, y_vals = zip(*points)
-    color = 'blue'
-    line, = ax.plot(x_vals, y_vals, color=color, linewidth=2)
-    drawable_artists.append(line)
-
-    for i in range(len(points) - 1):
-        x0, y0 = points[i]
-        x1, y1 = points[i + 1]
-        dx, dy = x1 - x0, y1 - y0
-        length = np.hypot(dx, dy)
-        if length == 0:
-            continue
-
-        num_triangles = int(length / 0.5)
-        for j in range(num_triangles):
-            frac = (j + 0.5) / num_triangles
-            xm = x0 + frac * dx
-            ym = y0 + frac * dy
-
-            # Angles
-            theta = np.arctan2(dy, dx)
-            theta_perp = theta + np.pi / 2
-
-            # Triangle geometry
-            base_len = 0.2
-            height = 0.1
-
-            tip_x = xm + height * np.cos(theta_perp)
-            tip_y = ym + height * np.sin(theta_perp)
-
-            base_left_x = xm - (base_len / 2) * np.cos(theta)
-            base_left_y = ym - (base_len / 2) * np.sin(theta)
-
-            base_right_x = xm + (base_len / 2) * np.cos(theta)
-            base_right_y = ym + (base_len / 2) * np.sin(theta)
+def triangle_points(xm, ym, theta, side=1):
+    """
+    Vertices of a front triangle centred on (xm, ym) along direction theta.
+    side=1 points the tip to the left of the front, side=-1 to the right.
+    """
+    base_len = 0.2
+    height = 0.1
+    theta_perp = theta + np.pi / 2
 
-            triangle = np.array([
-                [base_left_x, base_left_y],
-                [base_right_x, base_right_y],
-                [tip_x, tip_y]
-            ])
+    tip_x = xm + side * height * np.cos(theta_perp)
+    tip_y = ym + side * height * np.sin(theta_perp)
 
-            patch = ax.fill(triangle[:, 0], triangle[:, 1], color='blue', zorder=10)
-            drawable_artists.extend(patch)
+    base_left_x = xm - (base_len / 2) * np.cos(theta)
+    base_left_y = ym - (base_len / 2) * np.sin(theta)
 
-def draw_warm_front(ax, points):
-    x_vals, y_vals = zip(*points)
-    color = 'red'
-    line, = ax.plot(x_vals, y_vals, color=color, linewidth=2)
-    drawable_artists.append(line)
+    base_right_x = xm + (base_len / 2) * np.cos(theta)
+    base_right_y = ym + (base_len / 2) * np.sin(theta)
 
-    for i in range(len(points) - 1):
-        x0, y0 = points[i]
-        x1, y1 = points[i + 1]
-        dx, dy = x1 - x0, y1 - y0
-        length = np.hypot(dx, dy)
-        if length == 0:
-            continue
+    return [base_left_x, base_right_x, tip_x], [base_left_y, base_right_y, tip_y]
 
-        # Angle of the front segment
-        theta = np.arctan2(dy, dx)
+def semicircle_points(xm, ym, theta, closed=True):
+    """
+    Arc of a front semicircle centred on (xm, ym), bulging to the left of direction theta.
+    closed=True prepends the centre point so the shape can be filled.
+    """
+    radius = 0.1
+    num_pts = 20  # smoothness of the semicircle
 
-        # Number of semicircles
-        num_circles = int(length / 0.5)
-        for j in range(num_circles):
-            frac = (j + 0.5) / num_circles
-            xm = x0 + frac * dx
-            ym = y0 + frac * dy
+    angles = np.linspace(-np.pi / 2, np.pi / 2, num_pts)
+    # Rotate semicircle to match direction of the front
+    rotated_angles = angles + theta + (np.pi / 2)
 
-            # Semicircle parameters
-            radius = 0.1
-            num_pts = 20  # smoothness of the semicircle
+    x_circle = xm + radius * np.cos(rotated_angles)
+    y_circle = ym + radius * np.sin(rotated_angles)
 
-            angles = np.linspace(-np.pi / 2, np.pi / 2, num_pts)
-            # Rotate semicircle to match direction of the front
-            rotated_angles = angles + theta + (np.pi / 2)
+    if not closed:
+        return x_circle, y_circle
+    return np.concatenate(([xm], x_circle)), np.concatenate(([ym], y_circle))
 
-            x_circle = xm + radius * np.cos(rotated_angles)
-            y_circle = ym + radius * np.sin(rotated_angles)
+FRONT_COLORS = {
+    'cold': 'blue',
+    'warm': 'red',
+    'occluded': 'purple',
+    'dryline': 'orange',
+}
 
-            # Add center point to form a filled shape
-            x_full = np.concatenate(([xm], x_circle))
-            y_full = np.concatenate(([ym], y_circle))
+def front_shapes(front_type, points):
+    """
+    Yield the geometry of a front as (kind, color, xs, ys) tuples.
+    kind is 'line' (front line), 'fill' (triangle/semicircle) or 'outline' (dryline arc).
+    Used both for drawing on the axes and for exporting.
+    """
+    if front_type not in FRONT_COLORS and front_type != 'stationary':
+        raise ValueError(f"Unknown front type: {front_type!r}")
 
-            patch = ax.fill(x_full, y_full, color=color, zorder=10)
-            drawable_artists.extend(patch)
+    if front_type != 'stationary':
+        x_vals, y_vals = zip(*points)
+        yield 'line', FRONT_COLORS[front_type], x_vals, y_vals
 
-def draw_occluded_front(ax, points):
-    x_vals, y_vals = zip(*points)
-    color = 'purple'
-    line, = ax.plot(x_vals, y_vals, color=color, linewidth=2)
-    drawable_artists.append(line)
+    spacing = 0.2 if front_type == 'dryline' else 0.5
 
     for i in range(len(points) - 1):
         x0, y0 = points[i]
@@ -317,222 +326,267 @@ def draw_occluded_front(ax, points):
         if length == 0:
             continue
 
+        # Angle of the front segment
         theta = np.arctan2(dy, dx)
-        theta_perp = theta + np.pi / 2
 
-        num_symbols = int(length / 0.5)
+        num_symbols = int(length / spacing)
         for j in range(num_symbols):
+            if front_type == 'stationary':
+                # Alternating colored segments (connected to previous)
+                x_start = x0 + j / num_symbols * dx
+                y_start = y0 + j / num_symbols * dy
+                x_end = x0 + (j + 1) / num_symbols * dx
+                y_end = y0 + (j + 1) / num_symbols * dy
+                color = 'blue' if j % 2 == 0 else 'red'
+                yield 'line', color, [x_start, x_end], [y_start, y_end]
+
             frac = (j + 0.5) / num_symbols
             xm = x0 + frac * dx
             ym = y0 + frac * dy
 
-            if j % 2 == 0:
-                # Triangle
-                base_len = 0.2
-                height = 0.1
-
-                tip_x = xm + height * np.cos(theta_perp)
-                tip_y = ym + height * np.sin(theta_perp)
-
-                base_left_x = xm - (base_len / 2) * np.cos(theta)
-                base_left_y = ym - (base_len / 2) * np.sin(theta)
-
-                base_right_x = xm + (base_len / 2) * np.cos(theta)
-                base_right_y = ym + (base_len / 2) * np.sin(theta)
-
-                triangle = np.array([
-                    [base_left_x, base_left_y],
-                    [base_right_x, base_right_y],
-                    [tip_x, tip_y]
-                ])
-                patch = ax.fill(triangle[:, 0], triangle[:, 1], color=color, zorder=10)
-                drawable_artists.extend(patch)
-
-            else:
-                # Semicircle
-                radius = 0.1
-                num_pts = 20
-                angles = np.linspace(-np.pi / 2, np.pi / 2, num_pts)
-                rotated_angles = angles + theta_perp
-
-                x_circle = xm + radius * np.cos(rotated_angles)
-                y_circle = ym + radius * np.sin(rotated_angles)
-
-                x_full = np.concatenate(([xm], x_circle))
-                y_full = np.concatenate(([ym], y_circle))
-
-                patch = ax.fill(x_full, y_full, color=color, zorder=10)
-                drawable_artists.extend(patch)
-
-def draw_stationary_front(ax, points):
-    for i in range(len(points) - 1):
-        x0, y0 = points[i]
-        x1, y1 = points[i + 1]
-        dx, dy = x1 - x0, y1 - y0
-        length = np.hypot(dx, dy)
-        if length == 0:
-            continue
-
-        theta = np.arctan2(dy, dx)
-        theta_perp = theta + np.pi / 2
-
-        num_symbols = int(length / 0.5)
-        if num_symbols == 0:
-            continue
-
-        for j in range(num_symbols):
-            # Segment endpoints
-            start_frac = j / num_symbols
-            end_frac = (j + 1) / num_symbols
-
-            x_start = x0 + start_frac * dx
-            y_start = y0 + start_frac * dy
-            x_end = x0 + end_frac * dx
-            y_end = y0 + end_frac * dy
-
-            # Draw colored segment (connected to previous)
-            color = 'blue' if j % 2 == 0 else 'red'
-            line, = ax.plot([x_start, x_end], [y_start, y_end], color=color, linewidth=2)
+            if front_type == 'cold':
+                yield ('fill', 'blue') + tuple(triangle_points(xm, ym, theta))
+            elif front_type == 'warm':
+                yield ('fill', 'red') + tuple(semicircle_points(xm, ym, theta))
+            elif front_type == 'occluded':
+                if j % 2 == 0:
+                    yield ('fill', 'purple') + tuple(triangle_points(xm, ym, theta))
+                else:
+                    yield ('fill', 'purple') + tuple(semicircle_points(xm, ym, theta))
+            elif front_type == 'stationary':
+                if j % 2 == 0:
+                    # Blue triangle (cold side)
+                    yield ('fill', 'blue') + tuple(triangle_points(xm, ym, theta, side=-1))
+                else:
+                    # Red semicircle (warm side)
+                    yield ('fill', 'red') + tuple(semicircle_points(xm, ym, theta))
+            elif front_type == 'dryline':
+                # Unfilled semicircle (outline only)
+                yield ('outline', 'orange') + tuple(semicircle_points(xm, ym, theta, closed=False))
+
+def draw_front(ax, front_type, points):
+    for kind, color, xs, ys in front_shapes(front_type, points):
+        if kind == 'line':
+            line, = ax.plot(xs, ys, color=color, linewidth=2)
             drawable_artists.append(line)
+        elif kind == 'fill':
+            patch = ax.fill(xs, ys, color=color, zorder=10)
+            drawable_artists.extend(patch)
+        elif kind == 'outline':
+            patch = ax.plot(xs, ys, color=color, linewidth=1.5)
+            drawable_artists.extend(patch)
 
-            # Midpoint for symbol placement
-            xm = (x_start + x_end) / 2
-            ym = (y_start + y_end) / 2
-
-            if j % 2 == 0:
-                # Blue triangle (cold side)
-                base_len = 0.2
-                height = 0.1
-
-                tip_x = xm - height * np.cos(theta_perp)
-                tip_y = ym - height * np.sin(theta_perp)
-
-                base_left_x = xm - (base_len / 2) * np.cos(theta)
-                base_left_y = ym - (base_len / 2) * np.sin(theta)
-
-                base_right_x = xm + (base_len / 2) * np.cos(theta)
-                base_right_y = ym + (base_len / 2) * np.sin(theta)
-
-                triangle = np.array([
-                    [base_left_x, base_left_y],
-                    [base_right_x, base_right_y],
-                    [tip_x, tip_y]
-                ])
-                patch = ax.fill(triangle[:, 0], triangle[:, 1], color='blue', zorder=10)
-                drawable_artists.extend(patch)
-
-            else:
-                # Red semicircle (warm side)
-                radius = 0.1
-                num_pts = 20
-                angles = np.linspace(-np.pi / 2, np.pi / 2, num_pts)
-                rotated_angles = angles + theta_perp
-
-                x_circle = xm + radius * np.cos(rotated_angles)
-                y_circle = ym + radius * np.sin(rotated_angles)
+def draw_cold_front(ax, points):
+    draw_front(ax, 'cold', points)
 
-                x_full = np.concatenate(([xm], x_circle))
-                y_full = np.concatenate(([ym], y_circle))
+def draw_warm_front(ax, points):
+    draw_front(ax, 'warm', points)
 
-                patch = ax.fill(x_full, y_full, color='red', zorder=10)
-                drawable_artists.extend(patch)
+def draw_occluded_front(ax, points):
+    draw_front(ax, 'occluded', points)
 
+def draw_stationary_front(ax, points):
+    draw_front(ax, 'stationary', points)
 
 def draw_dryline(ax, points):
-    x_vals, y_vals = zip(*points)
-    color = 'orange'
-    line, = ax.plot(x_vals, y_vals, color=color, linewidth=2)
-    drawable_artists.append(line)
-
-    for i in range(len(points) - 1):
-        x0, y0 = points[i]
-        x1, y1 = points[i + 1]
-        dx, dy = x1 - x0, y1 - y0
-        length = np.hypot(dx, dy)
-        if length == 0:
-            continue
-
-        theta = np.arctan2(dy, dx)
-
-        num_circles = int(length / 0.2)
-        for j in range(num_circles):
-            frac = (j + 0.5) / num_circles
-            xm = x0 + frac * dx
-            ym = y0 + frac * dy
-
-            radius = 0.1
-            num_pts = 20
-            angles = np.linspace(-np.pi / 2, np.pi / 2, num_pts)
-            rotated_angles = angles + theta + (np.pi / 2)
+    draw_front(ax, 'dryline', points)
+
+
+# Vector export: streams stations, fronts and H/L markers straight to text,
+# one chunk at a time, without creating any matplotlib artists.
+def svg_polyline(xs, ys, to_svg):
+    return " ".join("%.2f,%.2f" % to_svg(x, y) for x, y in zip(xs, ys))
+
+def svg_station_shape(shape, to_svg):
+    kind = shape[0]
+    if kind == 'circle':
+        _, x, y, radius, facecolor = shape
+        sx, sy = to_svg(x, y)
+        return ('<circle cx="%.2f" cy="%.2f" r="%.2f" fill="%s" stroke="black" stroke-width="1.2"/>'
+                % (sx, sy, radius * SVG_SCALE, facecolor))
+    elif kind == 'wedge':
+        # Counter-clockwise from theta1 to theta2, as in matplotlib's Wedge
+        _, x, y, radius, theta1, theta2 = shape
+        span = (theta2 - theta1) % 360 or 360
+        sx, sy = to_svg(x, y)
+        x1, y1 = to_svg(x + radius * np.cos(np.radians(theta1)), y + radius * np.sin(np.radians(theta1)))
+        x2, y2 = to_svg(x + radius * np.cos(np.radians(theta2)), y + radius * np.sin(np.radians(theta2)))
+        return ('<path d="M %.2f,%.2f L %.2f,%.2f A %.2f,%.2f 0 %d 0 %.2f,%.2f Z" fill="black"/>'
+                % (sx, sy, x1, y1, radius * SVG_SCALE, radius * SVG_SCALE, span > 180, x2, y2))
+    elif kind == 'line':
+        _, xs, ys, color = shape
+        return ('<polyline points="%s" fill="none" stroke="%s" stroke-width="1"/>'
+                % (svg_polyline(xs, ys, to_svg), color))
+    elif kind == 'text':
+        _, x, y, text, color = shape
+        sx, sy = to_svg(x, y)
+        return '<text x="%.2f" y="%.2f" fill="%s">%s</text>' % (sx, sy, color, text)
+    raise ValueError(f"Unknown station shape: {kind!r}")
+
+def iter_svg(stations, fronts, markers, xlim, ylim):
+    """
+    Yield an SVG document in chunks. Map coordinates are scaled by SVG_SCALE
+    and flipped so that north is up.
+    """
+    def to_svg(x, y):
+        return (x - xlim[0]) * SVG_SCALE, (ylim[1] - y) * SVG_SCALE
+
+    width = (xlim[1] - xlim[0]) * SVG_SCALE
+    height = (ylim[1] - ylim[0]) * SVG_SCALE
+    yield ('<svg xmlns="http://www.w3.org/2000/svg" width="%.0f" height="%.0f" '
+           'viewBox="0 0 %.0f %.0f">\n' % (width, height, width, height))
+    yield '<rect width="100%" height="100%" fill="white"/>\n'
+
+    yield '<g id="stations" font-size="8">\n'
+    for station in stations:
+        yield '<g>'
+        for shape in station_shapes(station):
+            yield svg_station_shape(shape, to_svg)
+        yield '</g>\n'
+    yield '</g>\n'
+
+    yield '<g id="fronts">\n'
+    for front in fronts:
+        yield '<g class="%s">\n' % front['type']
+        for kind, color, xs, ys in front_shapes(front['type'], front['points']):
+            points = svg_polyline(xs, ys, to_svg)
+            if kind == 'fill':
+                yield '<polygon points="%s" fill="%s"/>\n' % (points, color)
+            else:
+                stroke_width = 2 if kind == 'line' else 1.5
+                yield ('<polyline points="%s" fill="none" stroke="%s" stroke-width="%s"/>\n'
+                       % (points, color, stroke_width))
+        yield '</g>\n'
+    yield '</g>\n'
+
+    yield '<g id="markers" font-size="20" font-weight="bold" text-anchor="middle" dominant-baseline="central">\n'
+    for marker_type, x, y in markers:
+        color = 'blue' if marker_type == 'H' else 'red'
+        sx, sy = to_svg(x, y)
+        yield '<text x="%.2f" y="%.2f" fill="%s">%s</text>\n' % (sx, sy, color, marker_type)
+    yield '</g>\n'
+    yield '</svg>\n'
+
+def iter_geojson_features(stations, fronts, markers):
+    for station in stations:
+        properties = {key: value for key, value in station.items() if key not in ('x', 'y')}
+        properties['kind'] = 'station'
+        yield {'type': 'Feature',
+               'geometry': {'type': 'Point', 'coordinates': [station['x'], station['y']]},
+               'properties': properties}
+
+    for front in fronts:
+        for kind, color, xs, ys in front_shapes(front['type'], front['points']):
+            coords = [[round(float(x), 6), round(float(y), 6)] for x, y in zip(xs, ys)]
+            if kind == 'fill':
+                geometry = {'type': 'Polygon', 'coordinates': [coords + [coords[0]]]}
+            else:
+                geometry = {'type': 'LineString', 'coordinates': coords}
+            yield {'type': 'Feature',
+                   'geometry': geometry,
+                   'properties': {'kind': 'front', 'front': front['type'], 'shape': kind, 'color': color}}
 
-            x_circle = xm + radius * np.cos(rotated_angles)
-            y_circle = ym + radius * np.sin(rotated_angles)
+    for marker_type, x, y in markers:
+        yield {'type': 'Feature',
+               'geometry': {'type': 'Point', 'coordinates': [float(x), float(y)]},
+               'properties': {'kind': 'marker', 'marker': marker_type}}
 
-            # Draw unfilled semicircle (outline only)
-            patch = ax.plot(x_circle, y_circle, color=color, linewidth=1.5)
-            drawable_artists.extend(patch)
+def iter_geojson(stations, fronts, markers):
+    """
+    Yield a GeoJSON FeatureCollection in chunks, one feature per line.
+    """
+    yield '{"type": "FeatureCollection", "features": [\n'
+    separator = ''
+    for feature in iter_geojson_features(stations, fronts, markers):
+        yield separator + json.dumps(feature)
+        separator = ',\n'
+    yield '\n]}\n'
+
+def write_chunks(path, chunks):
+    """
+    Stream chunks to a temporary file next to path, then move it into place,
+    so a failed export never leaves a truncated file behind.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.writelines(chunks)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+def export_analysis(event):
+    svg_path = os.path.abspath(EXPORT_BASENAME + '.svg')
+    geojson_path = os.path.abspath(EXPORT_BASENAME + '.geojson')
+    try:
+        write_chunks(svg_path, iter_svg(stations, analysis_fronts, marker_state['positions'],
+                                        ax.get_xlim(), ax.get_ylim()))
+        write_chunks(geojson_path, iter_geojson(stations, analysis_fronts, marker_state['positions']))
+    except OSError as e:
+        logger.error("Export failed: %s", e)
+        return
+    # Logged at WARNING so the confirmation shows at the default LOG_LEVEL
+    logger.warning("Exported analysis to %s and %s", svg_path, geojson_path)
 
 
-                
 fig.canvas.mpl_connect('key_press_event', on_key)
 fig.canvas.mpl_connect('button_press_event', on_click)
 
 
 
 
-# Function to draw cloud cover symbol
-def draw_cloud_cover(ax, x, y, cover):
+# Station model geometry. Shapes are yielded as tuples:
+#   ('circle', x, y, radius, facecolor)   black outline
+#   ('wedge', x, y, radius, theta1, theta2)   filled black, angles in degrees
+#   ('line', xs, ys, color)
+#   ('text', x, y, text, color)
+# Used both for drawing on the axes and for exporting.
+def cloud_cover_shapes(x, y, cover):
     """
-    Draw cloud cover at (x, y) based on fractional value (0.0 to 1.0),
+    Cloud cover at (x, y) based on fractional value (0.0 to 1.0),
     converted to oktas (0–8) with specific visual patterns.
     """
     radius = 0.07
     oktas = int(round(cover * 8))  # Convert 0.0–1.0 to 0–8
 
     # Base circle
-    circle = patches.Circle((x, y), radius, edgecolor='black', facecolor='none', linewidth=1.2)
-    ax.add_patch(circle)
+    yield 'circle', x, y, radius, 'none'
 
     if oktas == 0:
         return
 
     elif oktas == 1:
-        ax.plot([x, x], [y + radius, y - radius], color='black', linewidth=1)
+        yield 'line', [x, x], [y + radius, y - radius], 'black'
 
     elif oktas == 2:
-        wedge = patches.Wedge((x, y), radius, 0, 90, facecolor='black', edgecolor='none')
-        ax.add_patch(wedge)
+        yield 'wedge', x, y, radius, 0, 90
 
     elif oktas == 3:
-        wedge = patches.Wedge((x, y), radius, 0, 90, facecolor='black', edgecolor='none')
-        ax.add_patch(wedge)
-        ax.plot([x, x], [y + radius, y - radius], color='black', linewidth=1)
+        yield 'wedge', x, y, radius, 0, 90
+        yield 'line', [x, x], [y + radius, y - radius], 'black'
 
     elif oktas == 4:
-        wedge = patches.Wedge((x, y), radius, 270, 90, facecolor='black', edgecolor='none')
-        ax.add_patch(wedge)
+        yield 'wedge', x, y, radius, 270, 90
 
     elif oktas == 5:
-        wedge = patches.Wedge((x, y), radius, 270, 90, facecolor='black', edgecolor='none')
-        ax.add_patch(wedge)
-        ax.plot([x - radius, x + radius], [y, y], color='black', linewidth=1)
+        yield 'wedge', x, y, radius, 270, 90
+        yield 'line', [x - radius, x + radius], [y, y], 'black'
 
     elif oktas == 6:
-        wedge = patches.Wedge((x, y), radius, 0, 270, facecolor='black', edgecolor='none')
-        ax.add_patch(wedge)
+        yield 'wedge', x, y, radius, 0, 270
 
     elif oktas == 7:
-        full = patches.Circle((x, y), radius, edgecolor='black', facecolor='black', linewidth=1.2)
-        ax.add_patch(full)
-        ax.plot([x, x], [y + radius, y - radius], color='white', linewidth=1)
+        yield 'circle', x, y, radius, 'black'
+        yield 'line', [x, x], [y + radius, y - radius], 'white'
 
     elif oktas == 8:
-        full = patches.Circle((x, y), radius, edgecolor='black', facecolor='black', linewidth=1.2)
-        ax.add_patch(full)
+        yield 'circle', x, y, radius, 'black'
 
-def draw_wind_barb(ax, x, y, u, v):
+def wind_barb_shapes(x, y, u, v):
     """
-    Draws a wind barb at (x, y) using wind components u and v.
+    Wind barb at (x, y) using wind components u and v.
     Only draws barbs for speeds under 50 knots.
     """
     speed = np.sqrt(u**2 + v**2) * 1.94384  # Convert m/s to knots
@@ -549,11 +603,11 @@ def draw_wind_barb(ax, x, y, u, v):
 
     if speed < 1:
         # Calm: Circle
-        ax.add_patch(patches.Circle((x, y), 0.07, fill=False, edgecolor='black', linewidth=1.2))
+        yield 'circle', x, y, 0.07, 'none'
         return
 
-    # Draw main shaft
-    ax.plot([x, x_end], [y, y_end], color='black', linewidth=1)
+    # Main shaft
+    yield 'line', [x, x_end], [y, y_end], 'black'
 
     # Start placing barbs from the end of the shaft
     barb_x = x_end
@@ -565,26 +619,24 @@ def draw_wind_barb(ax, x, y, u, v):
     perp_dx = np.cos(angle)
     perp_dy = -np.sin(angle)
 
-    def draw_barb(x0, y0, length):
-        ax.plot([x0, x0 + perp_dx * length],
-                [y0, y0 + perp_dy * length],
-                color='black', linewidth=1)
+    def barb(x0, y0, length):
+        return 'line', [x0, x0 + perp_dx * length], [y0, y0 + perp_dy * length], 'black'
 
     # Limit to speeds under 50 knots
     remaining = min(speed, 45)
     barb_pos = 0
 
     while remaining >= 10:
-        draw_barb(barb_x - barb_pos * dx * barb_spacing,
-                  barb_y - barb_pos * dy * barb_spacing,
-                  barb_len)
+        yield barb(barb_x - barb_pos * dx * barb_spacing,
+                   barb_y - barb_pos * dy * barb_spacing,
+                   barb_len)
         remaining -= 10
         barb_pos += 1
 
     if remaining >= 5:
-        draw_barb(barb_x - barb_pos * dx * barb_spacing,
-                  barb_y - barb_pos * dy * barb_spacing,
-                  barb_len * 0.5)
+        yield barb(barb_x - barb_pos * dx * barb_spacing,
+                   barb_y - barb_pos * dy * barb_spacing,
+                   barb_len * 0.5)
 
 
 
@@ -594,16 +646,49 @@ def draw_wind_barb(ax, x, y, u, v):
     barb_pos = 0
 
     while remaining >= 10:
-        draw_barb(barb_x - barb_pos * dx * barb_spacing,
-                  barb_y - barb_pos * dy * barb_spacing,
-                  barb_len)
+        yield barb(barb_x - barb_pos * dx * barb_spacing,
+                   barb_y - barb_pos * dy * barb_spacing,
+                   barb_len)
         remaining -= 10
         barb_pos += 1
 
     if remaining >= 5:
-        draw_barb(barb_x - barb_pos * dx * barb_spacing,
-                  barb_y - barb_pos * dy * barb_spacing,
-                  barb_len * 0.5)
+        yield barb(barb_x - barb_pos * dx * barb_spacing,
+                   barb_y - barb_pos * dy * barb_spacing,
+                   barb_len * 0.5)
+
+def station_shapes(station):
+    x = station['x']
+    y = station['y']
+
+    yield from cloud_cover_shapes(x, y, station['cover'])
+    yield 'text', x - 0.3, y + 0.1, f"{station['temp']}", 'red'
+    yield 'text', x - 0.3, y - 0.1, f"{station['dew']}", 'green'
+    yield 'text', x + 0.1, y + 0.1, f"{station['pres']}", 'orange'
+    yield from wind_barb_shapes(x, y, station['u'], station['v'])
+
+def draw_station_shapes(ax, shapes):
+    for shape in shapes:
+        kind = shape[0]
+        if kind == 'circle':
+            _, x, y, radius, facecolor = shape
+            ax.add_patch(patches.Circle((x, y), radius, edgecolor='black', facecolor=facecolor, linewidth=1.2))
+        elif kind == 'wedge':
+            _, x, y, radius, theta1, theta2 = shape
+            ax.add_patch(patches.Wedge((x, y), radius, theta1, theta2, facecolor='black', edgecolor='none'))
+        elif kind == 'line':
+            _, xs, ys, color = shape
+            ax.plot(xs, ys, color=color, linewidth=1)
+        elif kind == 'text':
+            _, x, y, text, color = shape
+            ax.text(x, y, text, fontsize=8, color=color)
+
+# Function to draw cloud cover symbol
+def draw_cloud_cover(ax, x, y, cover):
+    draw_station_shapes(ax, cloud_cover_shapes(x, y, cover))
+
+def draw_wind_barb(ax, x, y, u, v):
+    draw_station_shapes(ax, wind_barb_shapes(x, y, u, v))
 
 # Example manual station data (x, y, temp, dewpoint, pressure, u_wind, v_wind, cloud_cover)
 stations = [
@@ -645,20 +730,7 @@ stations = [
 
 # Plot each station
 for station in stations:
-    x = station['x']
-    y = station['y']
-    temp = station['temp']
-    dew = station['dew']
-    pres = station['pres']
-    u = station['u']
-    v = station['v']
-    cover = station['cover']
-
-    draw_cloud_cover(ax, x, y, cover)
-    ax.text(x - 0.3, y + 0.1, f"{temp}", fontsize=8, color='red')
-    ax.text(x - 0.3, y - 0.1, f"{dew}", fontsize=8, color='green')
-    ax.text(x + 0.1, y + 0.1, f"{pres}", fontsize=8, color='orange')
-    draw_wind_barb(ax, x, y, u, v)
+    draw_station_shapes(ax, station_shapes(station))
 
 
 
@@ -667,6 +739,11 @@ button_ax = plt.axes([0.81, 0.01, 0.15, 0.05])  # [left, bottom, width, height]
 clear_button = Button(button_ax, 'Clear All')
 clear_button.on_clicked(clear_fronts_and_markers)
 
+# Create button to export the analysis to SVG and GeoJSON
+export_button_ax = plt.axes([0.65, 0.01, 0.15, 0.05])
+export_button = Button(export_button_ax, 'Export')
+export_button.on_clicked(export_analysis)
+
 btn_default.on_clicked(set_mode_default)
 btn_cold.on_clicked(set_mode_cold)
 btn_warm.on_clicked(set_mode_warm)